@@ -1,39 +1,375 @@
+import asyncio
+import hashlib
+import io
 import logging
+import os
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Iterator, List, Literal, Optional
 
 import duckdb
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query
+import orjson
+import pyarrow as pa
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 # Global connection variable
 conn = None
+# Cursors handed out to requests, created from `conn` at startup
+cursor_pool: asyncio.Queue | None = None
+# Whether the fts extension loaded, which searches with mode=text need
+fts_available = False
+
+# DUCKDB_THREADS sizes DuckDB's one worker pool, shared by every query on the
+# database, so it caps CPU use whatever the number of cursors. The cursor pool
+# only bounds how many queries are in flight at once, and is kept at least a
+# few deep so quick lookups needn't queue behind a slow search on small
+# instances
+DUCKDB_THREADS = int(os.getenv("DUCKDB_THREADS", "2"))
+DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", "1GB")
+POOL_SIZE = int(os.getenv("DUCKDB_POOL_SIZE", str(max(4, os.cpu_count() or 1))))
+# Whether to read every table into DuckDB's buffer pool at startup, so the
+# first requests don't pay for loading blocks from disk
+DUCKDB_WARMUP = os.getenv("DUCKDB_WARMUP", "true").lower() == "true"
+
+# Outcome of the last database health probe, reused for HEALTH_TTL seconds
+# so frequent polling by the load balancer doesn't hit the database each time
+HEALTH_TTL = 1.0
+_health = {"checked_at": 0.0, "ok": False}
+
+# Rows per chunk when streaming a response. JSON results with more rows than
+# this are streamed too, rather than built up in full before sending
+STREAM_BATCH_SIZE = 4096
+
+# Most rows a search may ask for, which bounds both the work per request and
+# the number of distinct no-query searches that can be cached
+MAX_SEARCH_LIMIT = 10_000
 
 _LOGGER = logging.getLogger(__name__)
 
+# Columns returned for each concept. These are fixed, so results never need
+# their column names read back from the cursor description
+CONCEPT_COLUMNS = (
+    "wikibase_id",
+    "preferred_label",
+    "alternative_labels",
+    "negative_labels",
+    "description",
+    "definition",
+    "labelled_passages",
+    "has_classifier",
+)
+_CONCEPT_COLUMNS_SQL = ", ".join(CONCEPT_COLUMNS)
+
+# Narrow projection for search and batch lookups, leaving out the label lists
+# and the large labelled_passages column
+SUMMARY_COLUMNS = ("wikibase_id", "preferred_label", "description")
+
+
+def _with_projections(template: str) -> dict[bool, str]:
+    """Render a query template for the full (True) and summary (False) columns."""
+    return {
+        True: template.format(columns=_CONCEPT_COLUMNS_SQL),
+        False: template.format(columns=", ".join(SUMMARY_COLUMNS)),
+    }
+
+
+# Every query the API runs has a fixed shape, with values always bound as
+# parameters, so each statement is defined once here and shared by the routes.
+# Searches take an optional has_classifier filter, which matches every row
+# when it's bound to NULL
+SEARCH_ALL_QUERY = _with_projections(
+    """
+    SELECT {columns}
+    FROM concepts
+    WHERE ($1::BOOLEAN IS NULL OR has_classifier = $1)
+    LIMIT $2
+"""
+)
+
+# Prefix searches compare against the lowercased label as a range, which
+# lets DuckDB skip row groups using their min/max statistics. Every label
+# starting with the prefix sorts between the prefix itself and the prefix
+# followed by the highest code point. The prefix is lowercased by DuckDB, as
+# the stored labels were, since Python's str.lower() differs for some letters
+SEARCH_BY_LABEL_QUERY = _with_projections(
+    """
+    SELECT {columns}
+    FROM concepts
+    WHERE preferred_label_lc >= lower($1)
+    AND preferred_label_lc < lower($1) || chr(1114111)
+    AND ($2::BOOLEAN IS NULL OR has_classifier = $2)
+    LIMIT $3
+"""
+)
+
+# Queries containing their own wildcards are still matched as patterns. The
+# pattern is lowercased once, by DuckDB as the stored labels were, and
+# compared with a case-sensitive LIKE against the lowercased label, rather
+# than case-folding every row
+SEARCH_BY_PATTERN_QUERY = _with_projections(
+    """
+    SELECT {columns}
+    FROM concepts
+    WHERE preferred_label_lc LIKE lower($1)
+    AND ($2::BOOLEAN IS NULL OR has_classifier = $2)
+    LIMIT $3
+"""
+)
+
+# Word searches use the full-text index built by create_duckdb.py, returning
+# the best BM25 matches first
+SEARCH_BY_TEXT_QUERY = _with_projections(
+    """
+    SELECT {columns}
+    FROM (
+        SELECT *, fts_main_concepts.match_bm25(wikibase_id, $1) AS score
+        FROM concepts
+    )
+    WHERE score IS NOT NULL
+    AND ($2::BOOLEAN IS NULL OR has_classifier = $2)
+    ORDER BY score DESC
+    LIMIT $3
+"""
+)
+
+# A single round trip: the related concepts and subconcepts are nested into
+# the same row as lists of structs. Each concept row carries its neighbours'
+# IDs, so they're fetched by primary key rather than through the relationship
+# tables, and the target row is read once and shared by all three
+CONCEPT_QUERY = f"""
+    WITH target AS MATERIALIZED (
+        SELECT {_CONCEPT_COLUMNS_SQL}, related_ids, subconcept_ids
+        FROM concepts
+        WHERE wikibase_id = $1
+    ),
+    concept AS (
+        SELECT {_CONCEPT_COLUMNS_SQL}
+        FROM target
+    ),
+    related AS (
+        SELECT {_CONCEPT_COLUMNS_SQL}
+        FROM concepts
+        WHERE wikibase_id IN (SELECT unnest(related_ids) FROM target)
+    ),
+    subconcepts AS (
+        SELECT {_CONCEPT_COLUMNS_SQL}
+        FROM concepts
+        WHERE wikibase_id IN (SELECT unnest(subconcept_ids) FROM target)
+    )
+    SELECT
+        (SELECT concept FROM concept) AS concept,
+        (SELECT list(related) FROM related) AS related_concepts,
+        (SELECT list(subconcepts) FROM subconcepts) AS subconcepts
+"""
+
+# The IDs are bound as one list parameter and unnested into a relation that
+# concepts is semi-joined against. The statement text is the same whatever
+# the batch size, and no ID is ever spliced into the SQL
+BATCH_QUERY = _with_projections(
+    """
+    SELECT {columns}
+    FROM concepts c
+    SEMI JOIN (SELECT unnest(?::VARCHAR[]) AS id) ids
+    ON c.wikibase_id = ids.id
+"""
+)
+
+HEALTH_QUERY = "SELECT 1"
+
+# Hashes every column of every table, which forces all of their blocks to be
+# read without returning any of the data
+WARMUP_QUERY = """
+    SELECT bit_xor(hash(COLUMNS(*))) FROM concepts;
+    SELECT bit_xor(hash(COLUMNS(*))) FROM concept_related_relations;
+    SELECT bit_xor(hash(COLUMNS(*))) FROM concept_subconcept_relations;
+"""
+
+
+class LRUCache:
+    """Least-recently-used cache of serialised response bodies.
 
-def get_db():
-    """Get database connection or raise error."""
-    if conn is None:
+    Bounded by both the number of entries and their total size, so a few
+    large results can't use up the instance's memory. The database is opened
+    read-only, so cached results never go stale. Only used from the event
+    loop, so it needs no locking.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key) -> bytes | None:
+        """Return the body cached for key, or None if there isn't one."""
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key, body: bytes):
+        """Cache a body, evicting the least recently used entries to fit it.
+
+        Bodies over an eighth of the byte budget aren't cached, so one large
+        result can't flush out everything else.
+        """
+        if len(body) > self.maxbytes // 8:
+            return
+        if (previous := self._entries.pop(key, None)) is not None:
+            self.nbytes -= len(previous)
+        self._entries[key] = body
+        self.nbytes += len(body)
+        while len(self._entries) > self.maxsize or self.nbytes > self.maxbytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= len(evicted)
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+
+# Caches of response bodies, within about 80MB in all. Empty and not-found
+# results aren't cached, so requests for unknown IDs can't push out useful
+# entries
+# No-query searches by (limit, has_classifier, full)
+_search_cache = LRUCache(maxsize=64, maxbytes=16 * 2**20)
+# Concept lookups by ID
+_concept_cache = LRUCache(maxsize=4096, maxbytes=32 * 2**20)
+# Batch lookups by (digest of the set of IDs, full)
+_batch_cache = LRUCache(maxsize=1024, maxbytes=32 * 2**20)
+
+
+def _clear_caches():
+    _search_cache.clear()
+    _concept_cache.clear()
+    _batch_cache.clear()
+
+
+@asynccontextmanager
+async def acquire_cursor():
+    """Borrow a database cursor from the pool, returning it on exit."""
+    if cursor_pool is None:
         raise HTTPException(
             status_code=500, detail="Database connection not initialised"
         )
-    return conn
+    cur = await cursor_pool.get()
+    try:
+        yield cur
+    finally:
+        cursor_pool.put_nowait(cur)
+
+
+def _fetch_table(cur: duckdb.DuckDBPyConnection, query: str, params: list) -> pa.Table:
+    """Run a query on a cursor and return its results as an Arrow table."""
+    return cur.execute(query, params).fetch_arrow_table()
+
+
+def _fetch_rows(cur: duckdb.DuckDBPyConnection, query: str, params: list) -> list:
+    """Run a query on a cursor and return its rows as dicts."""
+    # Going via Arrow builds the row dicts in C++ from DuckDB's columnar
+    # output rather than zipping every row tuple in Python
+    return _fetch_table(cur, query, params).to_pylist()
+
+
+def _embed_passages(concept: dict) -> dict:
+    """Embed a concept's labelled passages in its JSON as they're stored.
+
+    The column holds JSON text, so it's spliced into the response as is
+    rather than sent as a string or parsed and serialised again.
+    """
+    if (passages := concept.get("labelled_passages")) is not None:
+        concept["labelled_passages"] = orjson.Fragment(passages)
+    return concept
+
+
+def _json_rows(table: pa.Table | pa.RecordBatch) -> list:
+    """Convert rows to dicts ready to be serialised as JSON."""
+    return [_embed_passages(row) for row in table.to_pylist()]
+
+
+def _fetch_response_body(
+    cur: duckdb.DuckDBPyConnection, query: str, params: list
+) -> tuple[pa.Table, bytes | None]:
+    """Run a query, also returning its rows serialised as JSON unless it's
+    large enough to be streamed, in which case the body is None."""
+    table = _fetch_table(cur, query, params)
+    if table.num_rows > STREAM_BATCH_SIZE:
+        return table, None
+    return table, orjson.dumps(_json_rows(table))
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    """Take everything written to a buffer so far, leaving it empty."""
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+def _json_array_chunks(table: pa.Table) -> Iterator[bytes]:
+    """Encode a table's rows as a JSON array, a record batch at a time."""
+    yield b"["
+    separator = b""
+    for batch in table.to_batches(max_chunksize=STREAM_BATCH_SIZE):
+        if batch.num_rows:
+            # Strip the brackets so each batch's rows join the one array
+            yield separator + orjson.dumps(_json_rows(batch))[1:-1]
+            separator = b","
+    yield b"]"
+
+
+def _arrow_ipc_chunks(table: pa.Table) -> Iterator[bytes]:
+    """Encode a table as an Arrow IPC stream, a record batch at a time."""
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=STREAM_BATCH_SIZE):
+            writer.write_batch(batch)
+            yield _drain(sink)
+    yield _drain(sink)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    global conn
+    global conn, cursor_pool, fts_available
     try:
-        conn = duckdb.connect("concepts.db", read_only=True)
+        conn = duckdb.connect(
+            "concepts.db",
+            read_only=True,
+            config={"threads": DUCKDB_THREADS, "memory_limit": DUCKDB_MEMORY_LIMIT},
+        )
+        # Only word searches need full-text search, so the API still starts
+        # without it and serves everything else
+        try:
+            conn.load_extension("fts")
+            fts_available = True
+        except duckdb.Error as e:
+            _LOGGER.warning("⚠️ Full-text search unavailable: %s", e)
+        if DUCKDB_WARMUP:
+            conn.execute(WARMUP_QUERY)
+        # Each cursor is an independent connection to the same database, so
+        # concurrent requests don't queue behind one another
+        cursor_pool = asyncio.Queue(maxsize=POOL_SIZE)
+        for _ in range(POOL_SIZE):
+            cursor_pool.put_nowait(conn.cursor())
+        _clear_caches()
         _LOGGER.info("🔌 Database connection established")
         yield
     except Exception as e:
-        _LOGGER.error(f"❌ Database connection failed: {e}")
+        _LOGGER.error("❌ Database connection failed: %s", e)
         raise
     finally:
         # Shutdown
+        _clear_caches()
+        _health["ok"] = False
+        fts_available = False
+        if cursor_pool:
+            while not cursor_pool.empty():
+                cursor_pool.get_nowait().close()
+            cursor_pool = None
         if conn:
             conn.close()
             _LOGGER.info("🚪 Database connection closed")
@@ -45,101 +381,83 @@ router = APIRouter(
 app = FastAPI(
     title="Concepts API",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/concepts/docs",  # Docs will be available at /router_prefix/docs after mounting
     redoc_url="/concepts/redoc",
     openapi_url="/concepts/openapi.json",
 )
 
 
+def _search_all(
+    cur: duckdb.DuckDBPyConnection,
+    limit: int,
+    has_classifier: bool | None,
+    full: bool,
+) -> bytes | None:
+    """Serialised results of a search with no query, or None if empty."""
+    table = _fetch_table(cur, SEARCH_ALL_QUERY[full], [has_classifier, limit])
+    return orjson.dumps(_json_rows(table)) if table.num_rows else None
+
+
 @router.get("/search")
 async def search_concepts(
-    q: Optional[str] = None, limit: int = 10, has_classifier: bool | None = False
+    q: Optional[str] = None,
+    limit: int = Query(default=10, ge=1, le=MAX_SEARCH_LIMIT),  # noqa: B008
+    has_classifier: bool | None = False,
+    full: bool = True,
+    mode: Literal["prefix", "text"] = "prefix",
 ):
-    db = get_db()
+    """Search concepts by the start of their preferred label.
+
+    With mode=text, q is instead matched against the words in preferred
+    labels, returning the most relevant concepts first. Pass full=false to
+    return only each concept's ID, preferred label and description, which is
+    much smaller than the full row.
+    """
     if not q:
-        if has_classifier is not None:
-            result = db.execute(
-                """
-                SELECT
-                    wikibase_id,
-                    preferred_label,
-                    alternative_labels,
-                    negative_labels,
-                    description,
-                    definition,
-                    labelled_passages,
-                    has_classifier,
-                FROM concepts
-                WHERE has_classifier = ?
-                LIMIT ?
-                """,
-                [has_classifier, limit],
-            )
-        else:
-            result = db.execute(
-                """
-                SELECT
-                    wikibase_id,
-                    preferred_label,
-                    alternative_labels,
-                    negative_labels,
-                    description,
-                    definition,
-                    labelled_passages,
-                    has_classifier,
-                FROM concepts
-                LIMIT ?
-                """,
-                [limit],
+        # These results are the same on every call, so are served from cache
+        key = (limit, has_classifier, full)
+        if (body := _search_cache.get(key)) is None:
+            async with acquire_cursor() as cur:
+                body = await asyncio.to_thread(
+                    _search_all, cur, limit, has_classifier, full
+                )
+            if body is None:
+                raise HTTPException(status_code=404, detail="No results found")
+            _search_cache.put(key, body)
+        return Response(content=body, media_type="application/json")
+
+    if mode == "text":
+        if not fts_available:
+            raise HTTPException(
+                status_code=501, detail="Full-text search is not available"
             )
+        query, term = SEARCH_BY_TEXT_QUERY[full], q
+    elif "%" in q or "_" in q:
+        query, term = SEARCH_BY_PATTERN_QUERY[full], f"{q}%"
     else:
-        if has_classifier is not None:
-            result = db.execute(
-                """
-                SELECT
-                    wikibase_id,
-                    preferred_label,
-                    alternative_labels,
-                    negative_labels,
-                    description,
-                    definition,
-                    labelled_passages,
-                    has_classifier,
-                FROM concepts
-                WHERE preferred_label ILIKE ?
-                AND has_classifier = ?
-                LIMIT ?
-                """,
-                [f"{q}%", has_classifier, limit],
-            )
-        else:
-            result = db.execute(
-                """
-                SELECT
-                    wikibase_id,
-                    preferred_label,
-                    alternative_labels,
-                    negative_labels,
-                    description,
-                    definition,
-                    labelled_passages,
-                    has_classifier,
-                FROM concepts
-                WHERE preferred_label ILIKE ?
-                LIMIT ?
-                """,
-                [f"{q}%", limit],
-            )
+        query, term = SEARCH_BY_LABEL_QUERY[full], q
+    params = [term, has_classifier, limit]
+
+    async with acquire_cursor() as cur:
+        table, body = await asyncio.to_thread(_fetch_response_body, cur, query, params)
+
+    if not table.num_rows:
+        raise HTTPException(status_code=404, detail="No results found")
+
+    if body is None:
+        return StreamingResponse(
+            _json_array_chunks(table), media_type="application/json"
+        )
+    return Response(content=body, media_type="application/json")
 
-    if (
-        result is not None
-        and result.description is not None
-        and (rows := result.fetchall())
-    ):
-        columns = [desc[0] for desc in result.description]
-        return [dict(zip(columns, row, strict=False)) for row in rows]
 
-    raise HTTPException(status_code=404, detail="No results found")
+def _batch_digest(ids: List[str]) -> bytes:
+    """Identify a set of IDs for caching, whatever their order or repeats.
+
+    The set is hashed so cache keys stay small however large the batch.
+    """
+    return hashlib.blake2b(orjson.dumps(sorted(set(ids))), digest_size=16).digest()
 
 
 class BatchSearchModel(BaseModel):
@@ -147,53 +465,59 @@ class BatchSearchModel(BaseModel):
 
 
 @router.get("/batch_search")
-async def batch_search_concepts(dto: BatchSearchModel = Depends()):  # noqa: B008
+async def batch_search_concepts(
+    dto: BatchSearchModel = Depends(), full: bool = True  # noqa: B008
+):
     """Search for multiple concepts by their wikibase IDs.
 
     :param ids: List of wikibase IDs to search for
     :type ids: BatchSearchModel
+    :param full: Whether to return full rows, or just each concept's ID,
+        preferred label and description
+    :type full: bool
     :raises HTTPException: If no IDs provided or database error
     :return: List of found concepts (may be empty if no matches)
     :rtype: List[dict]
     """
-    _LOGGER.info(f"🔍 Searching for {len(dto.ids)} concepts")
+    _LOGGER.debug("🔍 Searching for %d concepts", len(dto.ids))
     if not dto.ids:
         raise HTTPException(status_code=400, detail="No IDs provided")
 
-    db = get_db()
+    # Results don't depend on the order of IDs or on repeats, so batches of
+    # the same IDs share a cache entry
+    key = (_batch_digest(dto.ids), full)
+    if (body := _batch_cache.get(key)) is not None:
+        return Response(content=body, media_type="application/json")
+
     try:
-        placeholders = ",".join([f"'{id}'" for id in dto.ids])
-        query = f"""
-            SELECT
-                wikibase_id,
-                preferred_label,
-                alternative_labels,
-                negative_labels,
-                description,
-                definition,
-                labelled_passages,
-                has_classifier
-            FROM concepts
-            WHERE wikibase_id IN ({placeholders})
-        """
-        result = db.execute(query)
-        matches = []
+        async with acquire_cursor() as cur:
+            table, body = await asyncio.to_thread(
+                _fetch_response_body, cur, BATCH_QUERY[full], [dto.ids]
+            )
+
+        # Log missing IDs for debugging. Each ID matches at most one row, so
+        # when there are as many rows as IDs requested none can be missing
         if (
-            result is not None
-            and result.description is not None
-            and (rows := result.fetchall())
+            table.num_rows
+            and table.num_rows < len(dto.ids)
+            and _LOGGER.isEnabledFor(logging.WARNING)
         ):
-            columns = [desc[0] for desc in result.description]
-            matches = [dict(zip(columns, row, strict=False)) for row in rows]
-
-            # Log missing IDs for debugging
-            found_ids = {match["wikibase_id"] for match in matches}
+            found_ids = set(table.column("wikibase_id").to_pylist())
             missing_ids = set(dto.ids) - found_ids
 
             if missing_ids:
-                _LOGGER.warning(f"🕵️ Missing IDs: {missing_ids}")
+                _LOGGER.warning("🕵️ Missing IDs: %s", missing_ids)
 
-        return matches
+        # Large results are streamed, and not cached so they can't crowd out
+        # everything else
+        if body is None:
+            return StreamingResponse(
+                _json_array_chunks(table), media_type="application/json"
+            )
+
+        if table.num_rows:
+            _batch_cache.put(key, body)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(
@@ -201,84 +525,84 @@ async def batch_search_concepts(dto: BatchSearchModel = Depends()):  # noqa: B00
         ) from Exception
 
 
-@router.get("/{concept_id}")
-async def get_concept(concept_id: str):
-    # Get column names from description
-    db = get_db()
+@router.get("/batch_search.arrow")
+async def batch_search_concepts_arrow(
+    dto: BatchSearchModel = Depends(), full: bool = True  # noqa: B008
+):
+    """Search for multiple concepts by their wikibase IDs, as Arrow.
 
-    concept = {}
-    result = db.execute(
-        """
-        SELECT 
-            wikibase_id,
-            preferred_label,
-            alternative_labels,
-            negative_labels,
-            description,
-            definition,
-            labelled_passages,
-            has_classifier,
-        FROM concepts 
-        WHERE wikibase_id = ?
-    """,
-        [concept_id],
-    )
-    if result is not None and result.description is not None:
-        columns = [desc[0] for desc in result.description]
-        row = result.fetchone()
+    Returns the same rows as /batch_search, streamed as an Arrow IPC stream
+    rather than JSON. This is much cheaper to produce and decode for large
+    batches.
 
-        if not row:
-            raise HTTPException(status_code=404, detail="Concept not found")
+    :param ids: List of wikibase IDs to search for
+    :type ids: BatchSearchModel
+    :param full: Whether to return full rows, or just each concept's ID,
+        preferred label and description
+    :type full: bool
+    :raises HTTPException: If no IDs provided
+    :return: Arrow IPC stream of found concepts
+    :rtype: StreamingResponse
+    """
+    if not dto.ids:
+        raise HTTPException(status_code=400, detail="No IDs provided")
 
-        concept = dict(zip(columns, row, strict=False))
+    # The results are fetched in full before streaming, so the cursor goes
+    # back to the pool straight away rather than waiting on a slow client
+    async with acquire_cursor() as cur:
+        table = await asyncio.to_thread(_fetch_table, cur, BATCH_QUERY[full], [dto.ids])
 
-    related = []
-    related_result = db.execute(
-        """
-        SELECT c.* FROM concepts c
-        JOIN concept_related_relations r 
-        ON c.wikibase_id = r.concept_id2 OR c.wikibase_id = r.concept_id1
-        WHERE r.concept_id1 = ? OR r.concept_id2 = ?
-    """,
-        [concept_id, concept_id],
-    )
-    if related_result is not None and related_result.description is not None:
-        related_columns = [desc[0] for desc in related_result.description]
-        related = [
-            dict(zip(related_columns, r, strict=False))
-            for r in related_result.fetchall()
-        ]
-
-    subconcepts = []
-    subconcepts_result = db.execute(
-        """
-        SELECT c.* FROM concepts c
-        JOIN concept_subconcept_relations r 
-        ON c.wikibase_id = r.subconcept_id
-        WHERE r.concept_id = ?
-    """,
-        [concept_id],
+    return StreamingResponse(
+        _arrow_ipc_chunks(table), media_type="application/vnd.apache.arrow.stream"
     )
-    if subconcepts_result is not None and subconcepts_result.description is not None:
-        subconcepts_columns = [desc[0] for desc in subconcepts_result.description]
-        subconcepts = [
-            dict(zip(subconcepts_columns, s, strict=False))
-            for s in subconcepts_result.fetchall()
-        ]
-
-    return {"concept": concept, "related_concepts": related, "subconcepts": subconcepts}
 
 
+# Declared before /{concept_id}, which would otherwise match /health
 @router.get("/health")
 async def health_check():
-    db = get_db()
-    try:
-        db.execute("SELECT 1").fetchone()
+    if _health["ok"] and time.monotonic() - _health["checked_at"] < HEALTH_TTL:
         return {"status": "healthy"}
-    except Exception:
-        raise HTTPException(
-            status_code=500, detail="Database connection failed"
-        ) from Exception
+
+    async with acquire_cursor() as cur:
+        try:
+            await asyncio.to_thread(_fetch_rows, cur, HEALTH_QUERY, [])
+        except Exception:
+            _health["ok"] = False
+            raise HTTPException(
+                status_code=500, detail="Database connection failed"
+            ) from Exception
+
+    _health.update(checked_at=time.monotonic(), ok=True)
+    return {"status": "healthy"}
+
+
+def _fetch_concept(cur: duckdb.DuckDBPyConnection, concept_id: str) -> bytes | None:
+    """Fetch a concept with its related concepts and subconcepts, serialised."""
+    (row,) = _fetch_rows(cur, CONCEPT_QUERY, [concept_id])
+    if row["concept"] is None:
+        return None
+
+    return orjson.dumps(
+        {
+            "concept": _embed_passages(row["concept"]),
+            "related_concepts": [
+                _embed_passages(c) for c in row["related_concepts"] or []
+            ],
+            "subconcepts": [_embed_passages(c) for c in row["subconcepts"] or []],
+        }
+    )
+
+
+@router.get("/{concept_id}")
+async def get_concept(concept_id: str):
+    if (body := _concept_cache.get(concept_id)) is None:
+        async with acquire_cursor() as cur:
+            body = await asyncio.to_thread(_fetch_concept, cur, concept_id)
+        if body is None:
+            raise HTTPException(status_code=404, detail="Concept not found")
+        _concept_cache.put(concept_id, body)
+
+    return Response(content=body, media_type="application/json")
 
 
 app.include_router(router)
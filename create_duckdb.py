@@ -1,4 +1,3 @@
-import glob
 import json
 import os
 from typing import List, Tuple
@@ -7,6 +6,14 @@ import duckdb
 import requests
 import yaml
 
+# Concept files to load. By default DuckDB reads them straight from S3; set
+# CONCEPTS_SOURCE to a local glob (e.g. "s3-concepts/concepts/*.json" after
+# running fetch_concepts_from_s3.py) to build from downloaded copies instead
+CONCEPTS_SOURCE = os.getenv(
+    "CONCEPTS_SOURCE", "s3://cpr-production-document-cache/concepts/*.json"
+)
+S3_REGION = "eu-west-1"
+
 
 def fetch_classifier_specs_file() -> Tuple[str, bool]:
     """
@@ -97,9 +104,38 @@ def get_classifier_specs() -> List[str]:
 
 
 def main():
+    # Get concepts with classifiers
+    try:
+        classifiers = get_classifier_specs()
+        print("Concepts with classifiers:", classifiers)
+    except ValueError as e:
+        print(f"Error: {e}")
+        # Optionally, you might want to exit or handle this differently
+        raise
+
     con = duckdb.connect("concepts.db")
+
+    if CONCEPTS_SOURCE.startswith("s3://"):
+        # Authenticate with whatever AWS credentials the environment provides,
+        # i.e. the instance role when running in App Runner
+        con.execute(
+            f"""
+        INSTALL httpfs;
+        LOAD httpfs;
+        INSTALL aws;
+        LOAD aws;
+        CREATE SECRET (TYPE S3, PROVIDER CREDENTIAL_CHAIN, REGION '{S3_REGION}');
+        """
+        )
+
+    # Drop, recreate and reload in one transaction, so a failed build leaves
+    # the previous tables in place rather than an empty database
+    con.begin()
+
     con.execute(
         """
+    -- The full-text index is built over concepts, so goes with it
+    DROP SCHEMA IF EXISTS fts_main_concepts CASCADE;
     DROP TABLE IF EXISTS concept_related_relations;
     DROP TABLE IF EXISTS concept_subconcept_relations;
     DROP TABLE IF EXISTS concepts;
@@ -118,6 +154,12 @@ def main():
         definition VARCHAR,
         labelled_passages JSON,
         has_classifier BOOLEAN,
+        -- Lowercased preferred_label, for case-insensitive prefix searches
+        preferred_label_lc VARCHAR,
+        -- Denormalised copies of the relationship tables, so get_concept
+        -- needn't join them
+        related_ids VARCHAR[],
+        subconcept_ids VARCHAR[],
     );
 
     -- Relationship tables with unique constraints
@@ -139,77 +181,137 @@ def main():
     """
     )
 
-    # Get concepts with classifiers
-    try:
-        classifiers = get_classifier_specs()
-        print("Concepts with classifiers:", classifiers)
-    except ValueError as e:
-        print(f"Error: {e}")
-        # Optionally, you might want to exit or handle this differently
-        raise
+    # Read every concept file in a single scan: DuckDB expands the glob and
+    # parses the files in parallel, fetching them concurrently from S3. Only
+    # the keys listed here are read
+    source = CONCEPTS_SOURCE.replace("'", "''")
+    con.execute(
+        f"""
+    CREATE TEMP TABLE concept_files AS
+    SELECT * FROM read_json(
+        '{source}',
+        format = 'auto',
+        columns = {{
+            'wikibase_id': 'VARCHAR',
+            'preferred_label': 'VARCHAR',
+            'alternative_labels': 'VARCHAR[]',
+            'negative_labels': 'VARCHAR[]',
+            'description': 'VARCHAR',
+            'definition': 'VARCHAR',
+            'labelled_passages': 'JSON',
+            'subconcept_of': 'VARCHAR[]',
+            'related_concepts': 'VARCHAR[]'
+        }}
+    );
+    """
+    )
 
-    # First pass: Insert all concepts into the database
-    json_files = glob.glob("s3-concepts/*.json")
-    for file_path in json_files:
-        with open(file_path, "r") as f:
-            data = json.load(f)
+    # Work out every relationship between concepts that exist before loading
+    # anything, since the concepts must be inserted before the relationships
+    # that reference them, but also carry them. Relationships are deduplicated
+    # here so the unique constraints are never hit, and related concepts are
+    # stored once per pair, with concept_id1 < concept_id2
+    con.execute(
+        """
+    CREATE TEMP TABLE subconcept_pairs AS
+    SELECT DISTINCT concept_id, subconcept_id
+    FROM (
+        SELECT wikibase_id AS concept_id, unnest(subconcept_of) AS subconcept_id
+        FROM concept_files
+    )
+    WHERE subconcept_id IN (SELECT wikibase_id FROM concept_files);
+
+    CREATE TEMP TABLE related_pairs AS
+    SELECT DISTINCT
+        least(wikibase_id, related_id) AS concept_id1,
+        greatest(wikibase_id, related_id) AS concept_id2,
+    FROM (
+        SELECT wikibase_id, unnest(related_concepts) AS related_id
+        FROM concept_files
+    )
+    WHERE related_id <> wikibase_id
+    AND related_id IN (SELECT wikibase_id FROM concept_files);
+    """
+    )
 
-        has_classifier = data["wikibase_id"] in classifiers
+    # Insert all concepts, each with its neighbours' IDs so get_concept
+    # needn't join the relationship tables. A related pair counts towards
+    # both of its concepts' lists. Rows are loaded in order of their
+    # lowercased label, so each row group covers a narrow range of labels and
+    # prefix searches can skip most of them
+    con.execute(
+        """
+    INSERT INTO concepts
+    SELECT
+        f.wikibase_id,
+        f.preferred_label,
+        f.alternative_labels,
+        f.negative_labels,
+        f.description,
+        f.definition,
+        f.labelled_passages,
+        list_contains(?::VARCHAR[], f.wikibase_id) AS has_classifier,
+        lower(f.preferred_label) AS preferred_label_lc,
+        r.ids AS related_ids,
+        s.ids AS subconcept_ids,
+    FROM concept_files f
+    LEFT JOIN (
+        SELECT concept_id, list(other_id ORDER BY other_id) AS ids
+        FROM (
+            SELECT concept_id1 AS concept_id, concept_id2 AS other_id
+            FROM related_pairs
+            UNION ALL
+            SELECT concept_id2 AS concept_id, concept_id1 AS other_id
+            FROM related_pairs
+        )
+        GROUP BY concept_id
+    ) r ON r.concept_id = f.wikibase_id
+    LEFT JOIN (
+        SELECT concept_id, list(subconcept_id ORDER BY subconcept_id) AS ids
+        FROM subconcept_pairs
+        GROUP BY concept_id
+    ) s ON s.concept_id = f.wikibase_id
+    ORDER BY preferred_label_lc
+    """,
+        [classifiers],
+    )
 
-        # Insert main concept data with ON CONFLICT DO NOTHING for deduplication
-        con.execute(
+    con.execute(
+        """
+    INSERT INTO concept_subconcept_relations (concept_id, subconcept_id)
+    SELECT concept_id, subconcept_id FROM subconcept_pairs;
+
+    INSERT INTO concept_related_relations (concept_id1, concept_id2)
+    SELECT concept_id1, concept_id2 FROM related_pairs;
+    """
+    )
+
+    missing_concepts = {
+        concept_id
+        for (concept_id,) in con.execute(
             """
-            INSERT INTO concepts VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                data["wikibase_id"],
-                data["preferred_label"],
-                data["alternative_labels"],
-                data["negative_labels"],
-                data["description"],
-                data["definition"],
-                data["labelled_passages"],
-                has_classifier,
-            ),
+        SELECT DISTINCT concept_id
+        FROM (
+            SELECT unnest(subconcept_of) AS concept_id FROM concept_files
+            UNION ALL
+            SELECT unnest(related_concepts) AS concept_id FROM concept_files
         )
+        WHERE concept_id NOT IN (SELECT wikibase_id FROM concepts)
+        """
+        ).fetchall()
+    }
+
+    con.commit()
 
-    # Second pass: Insert all relationships
-    missing_concepts = set()
-
-    for file_path in json_files:
-        with open(file_path, "r") as f:
-            data = json.load(f)
-
-        # Insert sub-concept relationships
-        for subconcept_id in data["subconcept_of"]:
-            try:
-                con.execute(
-                    """
-                    INSERT INTO concept_subconcept_relations (concept_id, subconcept_id)
-                    VALUES (?, ?)
-                """,
-                    (data["wikibase_id"], subconcept_id),
-                )
-            except duckdb.ConstraintException as e:
-                print(f"Error: {e}")
-                missing_concepts.add(subconcept_id)
-
-        # Insert related concept relationships
-        for related_id in data["related_concepts"]:
-            # Only insert if concept_id1 < concept_id2 to avoid duplicates
-            if data["wikibase_id"] < related_id:
-                try:
-
-                    con.execute(
-                        """
-                        INSERT INTO concept_related_relations (concept_id1, concept_id2)
-                        VALUES (?, ?)
-                    """,
-                        (data["wikibase_id"], related_id),
-                    )
-                except duckdb.ConstraintException as e:
-                    print(f"Error: {e}")
-                    missing_concepts.add(related_id)
+    # Full-text index over preferred labels, for searches by word rather than
+    # by prefix. The API loads the same extension to query it
+    con.execute(
+        """
+    INSTALL fts;
+    LOAD fts;
+    PRAGMA create_fts_index('concepts', 'wikibase_id', 'preferred_label');
+    """
+    )
 
     if missing_concepts:
         print(
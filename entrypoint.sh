@@ -1,7 +1,6 @@
 #!/bin/sh
-# TODO: This is probably not the place to do this as it increases startup time
-# significantly, but I can't seem to work out where else we can do it with the right permissions
-mkdir -p s3-concepts
-aws s3 sync s3://cpr-production-document-cache/concepts ./s3-concepts
+# TODO: This is probably not the place to build the database as it increases
+# startup time significantly, but I can't seem to work out where else we can do
+# it with the right permissions. The concept files are read directly from S3.
 python3 ./create_duckdb.py
 fastapi run ./app/api.py --port 8080
@@ -1,26 +1,72 @@
 import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import boto3
+from botocore.config import Config
 
-os.makedirs("./s3-concepts", exist_ok=True)
+BUCKET = "cpr-production-document-cache"
+# Each download is a small object, so time is dominated by request latency.
+# Run many at once, with enough pooled connections for every worker
+MAX_WORKERS = 64
+
+
+def download_with_s5cmd(s5cmd: str):
+    """Copy every concept file with s5cmd, which runs the transfers natively."""
+    subprocess.check_call(
+        [
+            s5cmd,
+            "--numworkers",
+            "256",
+            "cp",
+            f"s3://{BUCKET}/concepts/*",
+            "./s3-concepts/concepts/",
+        ]
+    )
+
+
+def download_with_boto3():
+    """Copy every concept file with boto3, from a pool of threads."""
+    s3 = boto3.client("s3", config=Config(max_pool_connections=MAX_WORKERS))
 
-s3 = boto3.client("s3")
+    paginator = s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(Bucket=BUCKET, Prefix="concepts")
 
-paginator = s3.get_paginator("list_objects_v2")
-pages = paginator.paginate(Bucket="cpr-production-document-cache", Prefix="concepts")
+    # List everything first, creating each directory once
+    jobs = []
+    created_dirs = set()
+    for page in pages:
+        for obj in page.get("Contents", []):
+            file_key = obj["Key"]
+            local_path = os.path.join("./s3-concepts", file_key)
 
-for page in pages:
-    for obj in page.get("Contents", []):
-        file_key = obj["Key"]
-        local_path = os.path.join("./s3-concepts", file_key)
+            # Ensure directories exist
+            local_dir = os.path.dirname(local_path)
+            if local_dir not in created_dirs:
+                os.makedirs(local_dir, exist_ok=True)
+                created_dirs.add(local_dir)
 
-        # Ensure directories exist
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            jobs.append((file_key, local_path))
+
+    print(f"Downloading {len(jobs)} files to ./s3-concepts...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                s3.download_file, Bucket=BUCKET, Key=file_key, Filename=local_path
+            )
+            for file_key, local_path in jobs
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+
+os.makedirs("./s3-concepts", exist_ok=True)
 
-        print(f"Downloading {file_key} to {local_path}...")
-        s3.download_file(
-            Bucket="cpr-production-document-cache", Key=file_key, Filename=local_path
-        )
+if s5cmd := shutil.which("s5cmd"):
+    download_with_s5cmd(s5cmd)
+else:
+    download_with_boto3()
 
 
 print("Done")